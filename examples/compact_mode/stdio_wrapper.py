@@ -44,9 +44,14 @@ def main():
         env=env
     )
     
-    # Filter output: JSON goes to stdout, everything else to stderr
+    # Filter output: JSON goes to stdout, everything else to stderr.
+    # Most lines can be classified by their first character; only lines
+    # with leading whitespace need a stripped copy.
     for line in p.stdout:
-        if line.lstrip().startswith(("{", "[")):
+        first = line[:1]
+        if first.isspace():
+            first = line.lstrip()[:1]
+        if first in ("{", "["):
             # JSON message - send to stdout for MCP client
             sys.stdout.write(line)
             sys.stdout.flush()
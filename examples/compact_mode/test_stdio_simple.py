@@ -9,54 +9,82 @@ Usage:
 
 import json
 import subprocess
-import time
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
 
-def test_tool(server_process, tool_name, arguments):
-    """Test a single tool call"""
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {
-            "name": tool_name,
-            "arguments": arguments
-        }
-    }
+# Fixed JSON-RPC envelope for tools/call; only id, name and arguments vary
+TOOL_CALL_PREFIX = b'{"jsonrpc": "2.0", "id": '
+TOOL_CALL_METHOD = b', "method": "tools/call", "params": {"name": '
 
-    # Send request
-    request_json = json.dumps(request) + "\n"
-    server_process.stdin.write(request_json)
-    server_process.stdin.flush()
 
-    # Read response (skip non-JSON lines)
-    for _ in range(10):  # Try up to 10 lines
-        response_line = server_process.stdout.readline()
-        if not response_line:
-            print(f"❌ {tool_name}: No response")
-            return False
-
-        line = response_line.strip()
-        if not line:
+def read_message(stdout):
+    """Read the next JSON-RPC message, skipping non-JSON lines"""
+    for line in stdout:
+        line = line.strip()
+        if not line.startswith(b"{"):
+            continue  # Skip non-JSON lines
+        try:
+            return json_loads(line)
+        except json.JSONDecodeError:  # orjson's error subclasses this too
             continue
+    return None
 
-        try:
-            response = json.loads(line)
-            if "result" in response:
-                content = response["result"].get("content", [{}])
-                result_text = content[0].get("text", "")
-                print(f"✅ {tool_name}: Success")
-                length = len(result_text)
-                print(f"   Response length: {length} characters")
-                print(f"   Response: {result_text[:200]}...")
-                return True
-            elif "error" in response:
-                print(f"❌ {tool_name}: Error")
-                print(f"   Error: {response['error']}")
-                print(f"   Raw response: {line[:200]}...")
-                return False
-        except json.JSONDecodeError:
-            continue  # Skip non-JSON lines
+
+def tool_call_request(request_id, tool_name, arguments):
+    """Encode a tools/call request as a JSON-RPC line"""
+    return (
+        TOOL_CALL_PREFIX + str(request_id).encode()
+        + TOOL_CALL_METHOD + json.dumps(tool_name).encode()
+        + b', "arguments": ' + json.dumps(arguments).encode() + b'}}\n'
+    )
+
+
+def run_tools(server_process, tests):
+    """Send all tool calls in one write, then collect responses by id"""
+    request_ids = range(1, len(tests) + 1)
+    payload = b"".join(
+        tool_call_request(request_id, tool_name, arguments)
+        for request_id, (tool_name, arguments) in zip(request_ids, tests)
+    )
+    server_process.stdin.write(payload)
+    server_process.stdin.flush()
+
+    # Read responses (skip notifications and messages for other ids)
+    responses = {}
+    pending = set(request_ids)
+    while pending:
+        response = read_message(server_process.stdout)
+        if response is None:
+            break  # Server closed its output
+        request_id = response.get("id")
+        if request_id in pending:
+            pending.discard(request_id)
+            responses[request_id] = response
+
+    return [responses.get(request_id) for request_id in request_ids]
+
+
+def check_response(tool_name, response):
+    """Report the outcome of a single tool call"""
+    if response is None:
+        print(f"❌ {tool_name}: No response")
+        return False
+
+    if "result" in response:
+        content = response["result"].get("content", [{}])
+        result_text = content[0].get("text", "")
+        print(f"✅ {tool_name}: Success")
+        length = len(result_text)
+        print(f"   Response length: {length} characters")
+        print(f"   Response: {result_text[:200]}...")
+        return True
+    elif "error" in response:
+        print(f"❌ {tool_name}: Error")
+        print(f"   Error: {response['error']}")
+        return False
 
     print(f"❌ {tool_name}: No valid response found")
     return False
@@ -71,14 +99,10 @@ def main():
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=0
     )
 
-    # Wait for server to start
-    time.sleep(2)
-
-    # Initialize
+    # Initialize (the request is buffered by the pipe until the server
+    # is ready, so no start-up delay is needed)
     init_request = {
         "jsonrpc": "2.0",
         "id": 0,
@@ -89,11 +113,14 @@ def main():
             "clientInfo": {"name": "test", "version": "1.0"}
         }
     }
-    server.stdin.write(json.dumps(init_request) + "\n")
+    server.stdin.write((json.dumps(init_request) + "\n").encode())
     server.stdin.flush()
 
-    # Read initialization response
-    server.stdout.readline()
+    # Wait for the initialization response
+    if read_message(server.stdout) is None:
+        print("❌ Server exited before initialization")
+        server.wait()
+        return
 
     # Send initialized notification
     notification = {
@@ -101,9 +128,8 @@ def main():
         "method": "notifications/initialized",
         "params": {}
     }
-    server.stdin.write(json.dumps(notification) + "\n")
+    server.stdin.write((json.dumps(notification) + "\n").encode())
     server.stdin.flush()
-    time.sleep(0.5)
 
     print("\nStarting tool tests...\n")
 
@@ -136,11 +162,13 @@ def main():
     success_count = 0
     total_count = len(tests)
 
-    for tool_name, args in tests:
+    # Pipeline all requests so the server can work through them while
+    # earlier responses are still being read
+    responses = run_tools(server, tests)
+    for (tool_name, _), response in zip(tests, responses):
         print(f"\nTesting: {tool_name}")
-        if test_tool(server, tool_name, args):
+        if check_response(tool_name, response):
             success_count += 1
-        time.sleep(0.5)
 
     print(f"\n{'='*50}")
     print(f"Test results: {success_count}/{total_count} successful")
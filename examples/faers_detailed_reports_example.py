@@ -23,6 +23,8 @@ analysis.
 import sys
 import os
 import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -34,22 +36,38 @@ MAX_JSON_LENGTH = 5000  # Max characters per report in JSON output
 # Note: Field extraction is now handled in the tool class itself via
 # extract_essential config in tool_config['fields']
 
+# Shared encoder so each report does not construct its own
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
 
-def example_search_basic_reports():
-    """Example: Search for basic adverse event reports for a drug"""
-    tu = ToolUniverse()
-    tu.load_tools()
 
-    result = tu.run({
-        "name": "FAERS_search_adverse_event_reports",
-        "arguments": {
-            "medicinalproduct": "Donanemab",
-            "limit": 3
-        }
-    }, use_cache=False)
+def dump_truncated(obj, max_len):
+    """Serialize obj as indented JSON, stopping once max_len is reached"""
+    chunks = []
+    length = 0
+    for chunk in _ENCODER.iterencode(obj):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > max_len:
+            return "".join(chunks)[:max_len] + "\n... (truncated)"
+    return "".join(chunks)
+
+
+_TU = None
+
+
+def _tu():
+    """Return a shared ToolUniverse, loading tools on first use"""
+    global _TU
+    if _TU is None:
+        _TU = ToolUniverse()
+        _TU.load_tools()
+    return _TU
 
+
+def _display(title, result):
+    """Print a header and a truncated view of the returned reports"""
     print(f"\n{'='*80}")
-    print("Example 1: Basic Adverse Event Reports Search")
+    print(title)
     print(f"{'='*80}")
     print(f"Found {len(result) if isinstance(result, list) else 0} reports")
 
@@ -57,10 +75,7 @@ def example_search_basic_reports():
         # Show limited number of reports
         reports_to_show = result[:MAX_REPORTS_TO_SHOW]
         for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
+            report_json = dump_truncated(report, MAX_JSON_LENGTH)
             print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
             print(report_json)
         if len(result) > MAX_REPORTS_TO_SHOW:
@@ -68,14 +83,28 @@ def example_search_basic_reports():
             print(f"\n... and {remaining} more reports "
                   f"(showing first {MAX_REPORTS_TO_SHOW} only)")
     else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        # Error payloads can be large; encode only what will be shown
+        print(dump_truncated(result, MAX_JSON_LENGTH))
+
+
+def example_search_basic_reports():
+    """Example: Search for basic adverse event reports for a drug"""
+    tu = _tu()
+
+    result = tu.run({
+        "name": "FAERS_search_adverse_event_reports",
+        "arguments": {
+            "medicinalproduct": "Donanemab",
+            "limit": 3
+        }
+    }, use_cache=False)
+
     return result
 
 
 def example_search_by_reaction():
     """Example: Search for reports with a specific drug and reaction"""
-    tu = ToolUniverse()
-    tu.load_tools()
+    tu = _tu()
 
     result = tu.run({
         "name": "FAERS_search_reports_by_drug_and_reaction",
@@ -86,33 +115,12 @@ def example_search_by_reaction():
         }
     }, use_cache=False)
 
-    print(f"\n{'='*80}")
-    print("Example 2: Search by Drug and Specific Reaction")
-    print(f"{'='*80}")
-    print(f"Found {len(result) if isinstance(result, list) else 0} reports")
-
-    if isinstance(result, list) and len(result) > 0:
-        reports_to_show = result[:MAX_REPORTS_TO_SHOW]
-        for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
-            print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
-            print(report_json)
-        if len(result) > MAX_REPORTS_TO_SHOW:
-            remaining = len(result) - MAX_REPORTS_TO_SHOW
-            print(f"\n... and {remaining} more reports "
-                  f"(showing first {MAX_REPORTS_TO_SHOW} only)")
-    else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
     return result
 
 
 def example_search_serious_reports():
     """Example: Search for serious adverse events (fatal cases)"""
-    tu = ToolUniverse()
-    tu.load_tools()
+    tu = _tu()
 
     result = tu.run({
         "name": "FAERS_search_serious_reports_by_drug",
@@ -123,33 +131,12 @@ def example_search_serious_reports():
         }
     }, use_cache=False)
 
-    print(f"\n{'='*80}")
-    print("Example 3: Search for Serious Adverse Events (Fatal Cases)")
-    print(f"{'='*80}")
-    print(f"Found {len(result) if isinstance(result, list) else 0} reports")
-
-    if isinstance(result, list) and len(result) > 0:
-        reports_to_show = result[:MAX_REPORTS_TO_SHOW]
-        for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
-            print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
-            print(report_json)
-        if len(result) > MAX_REPORTS_TO_SHOW:
-            remaining = len(result) - MAX_REPORTS_TO_SHOW
-            print(f"\n... and {remaining} more reports "
-                  f"(showing first {MAX_REPORTS_TO_SHOW} only)")
-    else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
     return result
 
 
 def example_search_by_indication():
     """Example: Search for reports by drug and indication"""
-    tu = ToolUniverse()
-    tu.load_tools()
+    tu = _tu()
 
     result = tu.run({
         "name": "FAERS_search_reports_by_drug_and_indication",
@@ -160,33 +147,12 @@ def example_search_by_indication():
         }
     }, use_cache=False)
 
-    print(f"\n{'='*80}")
-    print("Example 4: Search by Drug and Indication")
-    print(f"{'='*80}")
-    print(f"Found {len(result) if isinstance(result, list) else 0} reports")
-
-    if isinstance(result, list) and len(result) > 0:
-        reports_to_show = result[:MAX_REPORTS_TO_SHOW]
-        for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
-            print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
-            print(report_json)
-        if len(result) > MAX_REPORTS_TO_SHOW:
-            remaining = len(result) - MAX_REPORTS_TO_SHOW
-            print(f"\n... and {remaining} more reports "
-                  f"(showing first {MAX_REPORTS_TO_SHOW} only)")
-    else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
     return result
 
 
 def example_search_by_outcome():
     """Example: Search for reports by reaction outcome"""
-    tu = ToolUniverse()
-    tu.load_tools()
+    tu = _tu()
 
     result = tu.run({
         "name": "FAERS_search_reports_by_drug_and_outcome",
@@ -197,33 +163,12 @@ def example_search_by_outcome():
         }
     }, use_cache=False)
 
-    print(f"\n{'='*80}")
-    print("Example 5: Search by Reaction Outcome")
-    print(f"{'='*80}")
-    print(f"Found {len(result) if isinstance(result, list) else 0} reports")
-
-    if isinstance(result, list) and len(result) > 0:
-        reports_to_show = result[:MAX_REPORTS_TO_SHOW]
-        for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
-            print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
-            print(report_json)
-        if len(result) > MAX_REPORTS_TO_SHOW:
-            remaining = len(result) - MAX_REPORTS_TO_SHOW
-            print(f"\n... and {remaining} more reports "
-                  f"(showing first {MAX_REPORTS_TO_SHOW} only)")
-    else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
     return result
 
 
 def example_search_drug_interactions():
     """Example: Search for drug interaction reports"""
-    tu = ToolUniverse()
-    tu.load_tools()
+    tu = _tu()
 
     result = tu.run({
         "name": "FAERS_search_reports_by_drug_combination",
@@ -233,26 +178,6 @@ def example_search_drug_interactions():
         }
     }, use_cache=False)
 
-    print(f"\n{'='*80}")
-    print("Example 6: Search for Drug Interaction Reports")
-    print(f"{'='*80}")
-    print(f"Found {len(result) if isinstance(result, list) else 0} reports")
-
-    if isinstance(result, list) and len(result) > 0:
-        reports_to_show = result[:MAX_REPORTS_TO_SHOW]
-        for i, report in enumerate(reports_to_show):
-            report_json = json.dumps(report, indent=2, ensure_ascii=False)
-            if len(report_json) > MAX_JSON_LENGTH:
-                report_json = (report_json[:MAX_JSON_LENGTH] +
-                               "\n... (truncated)")
-            print(f"\n--- Report {i+1} of {len(reports_to_show)} ---")
-            print(report_json)
-        if len(result) > MAX_REPORTS_TO_SHOW:
-            remaining = len(result) - MAX_REPORTS_TO_SHOW
-            print(f"\n... and {remaining} more reports "
-                  f"(showing first {MAX_REPORTS_TO_SHOW} only)")
-    else:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
     return result
 
 
@@ -266,22 +191,42 @@ def main():
     print("\nNote: Results may vary based on available data in FAERS.")
 
     examples = [
-        ("Basic Reports", example_search_basic_reports),
-        ("Drug + Reaction", example_search_by_reaction),
-        ("Serious Events", example_search_serious_reports),
-        ("Drug + Indication", example_search_by_indication),
-        ("Reaction Outcome", example_search_by_outcome),
-        ("Drug Interactions", example_search_drug_interactions),
+        ("Basic Reports",
+         "Example 1: Basic Adverse Event Reports Search",
+         example_search_basic_reports),
+        ("Drug + Reaction",
+         "Example 2: Search by Drug and Specific Reaction",
+         example_search_by_reaction),
+        ("Serious Events",
+         "Example 3: Search for Serious Adverse Events (Fatal Cases)",
+         example_search_serious_reports),
+        ("Drug + Indication",
+         "Example 4: Search by Drug and Indication",
+         example_search_by_indication),
+        ("Reaction Outcome",
+         "Example 5: Search by Reaction Outcome",
+         example_search_by_outcome),
+        ("Drug Interactions",
+         "Example 6: Search for Drug Interaction Reports",
+         example_search_drug_interactions),
     ]
 
+    # Load tools once up front so the worker threads share the instance
+    _tu()
+
+    # The API calls are network-bound, so run them concurrently and then
+    # display the results in order
     results = {}
-    for name, func in examples:
-        try:
-            results[name] = func()
-        except Exception as e:
-            print(f"\n❌ Error in {name} example: {e}")
-            import traceback
-            traceback.print_exc()
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [(name, title, executor.submit(func))
+                   for name, title, func in examples]
+        for name, title, future in futures:
+            try:
+                results[name] = future.result()
+                _display(title, results[name])
+            except Exception as e:
+                print(f"\n❌ Error in {name} example: {e}")
+                traceback.print_exception(e)
 
     print("\n" + "="*80)
     print("Summary")
@@ -11,6 +11,67 @@ import sys
 import subprocess
 from pathlib import Path
 
+BUFFER_SIZE = 65536
+
+# Byte lookup tables for classifying lines without allocating a stripped copy
+WHITESPACE = bytes(c in b" \t\n\r\x0b\x0c" for c in range(256))
+JSON_START = bytes(c in b"{[" for c in range(256))
+
+
+def _iov_max():
+    """Return the limit on buffers per os.writev() call, defaulting to 1024."""
+    try:
+        value = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return 1024
+    # sysconf() may report -1 when the limit is indeterminate
+    return value if value > 0 else 1024
+
+
+# Upper bound on buffers passed to a single os.writev() call
+IOV_MAX = _iov_max()
+
+
+def _write_all(fd, data):
+    """Write all of data to fd, retrying on partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _is_json(line):
+    """Return True if the first non-whitespace byte opens a JSON value."""
+    i = 0
+    n = len(line)
+    while i < n and WHITESPACE[line[i]]:
+        i += 1
+    return i < n and JSON_START[line[i]]
+
+
+def _write_lines(fd, lines):
+    """Write lines to fd with one vectored write per batch."""
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(lines))
+        return
+    for start in range(0, len(lines), IOV_MAX):
+        batch = lines[start:start + IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            _write_all(fd, b"".join(batch)[written:])
+
+
+def _route(lines, out_fd, err_fd):
+    """Send JSON lines to stdout and everything else to stderr."""
+    out_lines = []
+    err_lines = []
+    for line in lines:
+        (out_lines if _is_json(line) else err_lines).append(line)
+    if out_lines:
+        _write_lines(out_fd, out_lines)
+    if err_lines:
+        _write_lines(err_fd, err_lines)
+
+
 def main():
     """Run SMCP server with STDIO wrapper."""
     
@@ -35,19 +96,28 @@ def main():
         cmd,
         stdout=subprocess.PIPE,
         stderr=sys.stderr,
-        text=True,
-        bufsize=1,
+        bufsize=0,
         env=env
     )
     
-    # Filter output: JSON goes to stdout, everything else to stderr
-    for line in p.stdout:
-        if line.lstrip().startswith(("{", "[")):
-            sys.stdout.write(line)
-            sys.stdout.flush()
-        else:
-            sys.stderr.write(line)
-            sys.stderr.flush()
+    # Filter output: JSON goes to stdout, everything else to stderr.
+    # Read whatever is available with one os.read() on the raw pipe and
+    # split complete lines, keeping a trailing partial line in the buffer
+    # for the next chunk.
+    # Each chunk's lines are flushed with one write per destination.
+    in_fd = p.stdout.fileno()
+    out_fd = sys.stdout.fileno()
+    err_fd = sys.stderr.fileno()
+    buf = bytearray()
+    while chunk := os.read(in_fd, BUFFER_SIZE):
+        buf += chunk
+        end = buf.rfind(b"\n") + 1
+        if not end:
+            continue
+        _route(bytes(buf[:end]).splitlines(keepends=True), out_fd, err_fd)
+        del buf[:end]
+    if buf:
+        _route([bytes(buf)], out_fd, err_fd)
     
     p.wait()
     sys.exit(p.returncode)
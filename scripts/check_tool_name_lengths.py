@@ -10,14 +10,16 @@ from __future__ import annotations
 
 import argparse
 import sys
+from itertools import compress
+from operator import itemgetter
 from typing import List, Tuple
 
 
-def check_tool_name_lengths(max_len: int = 64) -> Tuple[List[str], List[str]]:
+def check_tool_name_lengths(max_len: int = 64) -> Tuple[int, List[str]]:
     """
     Load all tools via ToolUniverse and check their name lengths.
 
-    Returns a tuple of (valid_names, invalid_names) where invalid_names are
+    Returns a tuple of (valid_count, invalid_names) where invalid_names are
     those exceeding max_len.
     """
     # Import locally to avoid import overhead when used as a library
@@ -27,26 +29,22 @@ def check_tool_name_lengths(max_len: int = 64) -> Tuple[List[str], List[str]]:
     # Load all built-in/configured tools
     tool_universe.load_tools()
 
-    # Retrieve only names for efficient scanning
-    tool_names = tool_universe.get_available_tools(name_only=True)
+    # Stream names straight from the loaded configs; only violations are kept.
+    # The map/compress chain keeps the per-name length check in C.
+    tools = tool_universe.all_tools
+    get_name = itemgetter("name")
+    too_long = map(max_len.__lt__, map(len, map(get_name, tools)))
+    invalid: List[str] = list(compress(map(get_name, tools), too_long))
+    valid_count = len(tools) - len(invalid)
 
-    valid: List[str] = []
-    invalid: List[str] = []
+    return valid_count, invalid
 
-    for name in tool_names:
-        if len(name) <= max_len:
-            valid.append(name)
-        else:
-            invalid.append(name)
 
-    return valid, invalid
-
-
-def _format_report(valid: List[str], invalid: List[str], max_len: int) -> str:
+def _format_report(valid_count: int, invalid: List[str], max_len: int) -> str:
     lines: List[str] = []
     lines.append(f"Max allowed length: {max_len}")
-    lines.append(f"Total tools scanned: {len(valid) + len(invalid)}")
-    lines.append(f"Valid (≤{max_len}): {len(valid)}")
+    lines.append(f"Total tools scanned: {valid_count + len(invalid)}")
+    lines.append(f"Valid (≤{max_len}): {valid_count}")
     lines.append(f"Invalid (>{max_len}): {len(invalid)}")
     if invalid:
         lines.append("")
@@ -69,8 +67,8 @@ def main(argv: List[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    valid, invalid = check_tool_name_lengths(max_len=args.max_len)
-    report = _format_report(valid, invalid, args.max_len)
+    valid_count, invalid = check_tool_name_lengths(max_len=args.max_len)
+    report = _format_report(valid_count, invalid, args.max_len)
     print(report)
 
     # Non-zero exit when violations are present (useful in CI)
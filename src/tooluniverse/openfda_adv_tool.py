@@ -4,6 +4,7 @@ import requests
 import urllib.parse
 from .base_tool import BaseTool
 from .tool_registry import register_tool
+from .utils import get_pooled_session
 
 # ---- Helper: human readable -> openFDA code mapping ----
 HUMAN_TO_FDA_MAP = {
@@ -86,6 +87,8 @@ class FDADrugAdverseEventTool(BaseTool):
             "return_fields_mapping", {}
         )
 
+        self.session = get_pooled_session(self.endpoint_url)
+
         if not self.count_field:
             raise ValueError(
                 "Either 'count_field' or 'return_fields' must be defined in tool_config."
@@ -178,7 +181,7 @@ class FDADrugAdverseEventTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -309,7 +312,7 @@ class FDACountAdditiveReactionsTool(FDADrugAdverseEventTool):
             )
 
         try:
-            resp = requests.get(url)
+            resp = self.session.get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if resp.status_code == 404:
                 try:
@@ -348,6 +351,8 @@ class FDADrugAdverseEventDetailTool(BaseTool):
         self.search_fields = tool_config.get("fields", {}).get("search_fields", {})
         self.return_fields = tool_config.get("fields", {}).get("return_fields", [])
 
+        self.session = get_pooled_session(self.endpoint_url)
+
         # Store allowed enum values
         self.parameter_enums = {}
         if "parameter" in tool_config and "properties" in tool_config["parameter"]:
@@ -428,7 +433,7 @@ class FDADrugAdverseEventDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -675,6 +680,8 @@ class FDADrugInteractionDetailTool(BaseTool):
         self.search_fields = tool_config.get("fields", {}).get("search_fields", {})
         self.return_fields = tool_config.get("fields", {}).get("return_fields", [])
 
+        self.session = get_pooled_session(self.endpoint_url)
+
         # Store allowed enum values
         self.parameter_enums = {}
         if "parameter" in tool_config and "properties" in tool_config["parameter"]:
@@ -768,7 +775,7 @@ class FDADrugInteractionDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
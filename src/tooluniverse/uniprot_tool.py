@@ -3,6 +3,7 @@ import requests
 from typing import Any, Dict, Optional
 from .base_tool import BaseTool, ToolError
 from .tool_registry import register_tool
+from .utils import get_pooled_session
 
 
 @register_tool("UniProtRESTTool")
@@ -13,6 +14,8 @@ class UniProtRESTTool(BaseTool):
         self.extract_path = tool_config["fields"].get("extract_path")
         self.timeout = 15  # Increase timeout for large entries
 
+        self.session = get_pooled_session("https://rest.uniprot.org")
+
     def validate_parameters(self, arguments: Dict[str, Any]) -> Optional[ToolError]:
         """
         Validate parameters with automatic type coercion for limit.
@@ -172,7 +175,7 @@ class UniProtRESTTool(BaseTool):
         url = "https://rest.uniprot.org/uniprotkb/search"
 
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = self.session.get(url, params=params, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
 
@@ -267,7 +270,7 @@ class UniProtRESTTool(BaseTool):
         payload = {"ids": ids, "from": from_db_normalized, "to": to_db_normalized}
 
         try:
-            resp = requests.post(submit_url, json=payload, timeout=self.timeout)
+            resp = self.session.post(submit_url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
             job_data = resp.json()
             job_id = job_data.get("jobId")
@@ -281,12 +284,12 @@ class UniProtRESTTool(BaseTool):
 
             start_time = time.time()
             while time.time() - start_time < max_wait_time:
-                status_resp = requests.get(status_url, timeout=self.timeout)
+                status_resp = self.session.get(status_url, timeout=self.timeout)
                 status_data = status_resp.json()
 
                 if status_data.get("status") == "FINISHED":
                     # Step 3: Retrieve results
-                    results_resp = requests.get(results_url, timeout=self.timeout)
+                    results_resp = self.session.get(results_url, timeout=self.timeout)
                     results_data = results_resp.json()
 
                     # Format results
@@ -354,7 +357,7 @@ class UniProtRESTTool(BaseTool):
         # Build URL for standard accession-based queries
         url = self._build_url(arguments)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = self.session.get(url, timeout=self.timeout)
             if resp.status_code != 200:
                 return {
                     "error": (f"UniProt API returned status code: {resp.status_code}"),
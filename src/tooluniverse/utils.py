@@ -5,7 +5,11 @@ import hashlib
 import os
 import time
 import sys
+import threading
 from typing import Dict, Any, Union, List
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
 from huggingface_hub import hf_hub_download
 from pydantic._internal._model_construction import ModelMetaclass
 
@@ -74,6 +78,31 @@ def get_md5(input_str):
     return md5_hash.hexdigest()
 
 
+_HTTP_ADAPTERS: Dict[str, HTTPAdapter] = {}
+_HTTP_ADAPTERS_LOCK = threading.Lock()
+
+
+def get_pooled_session(base_url: str) -> requests.Session:
+    """
+    Create a requests.Session whose connection pool is shared per API host.
+
+    Each call returns a new Session with its own headers and cookie jar, but
+    every session created for the same scheme and host mounts the same
+    HTTPAdapter. Separate tool instances calling one API therefore reuse
+    keep-alive connections. The underlying urllib3 pool is thread-safe.
+    """
+    parts = urlsplit(base_url)
+    prefix = f"{parts.scheme}://{parts.netloc}/"
+    with _HTTP_ADAPTERS_LOCK:
+        adapter = _HTTP_ADAPTERS.get(prefix)
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=20)
+            _HTTP_ADAPTERS[prefix] = adapter
+    session = requests.Session()
+    session.mount(prefix, adapter)
+    return session
+
+
 def get_user_cache_dir() -> str:
     """
     Return a cross-platform user cache directory for ToolUniverse.